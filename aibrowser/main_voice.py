@@ -6,6 +6,7 @@ import asyncio
 import logging
 import os
 import sys
+from typing import Callable, Optional
 
 import aiohttp
 
@@ -35,6 +36,17 @@ def setup_logging() -> None:
 	logging.getLogger('httpcore').setLevel(logging.WARNING)
 
 
+def uvloop_factory() -> Optional[Callable[[], asyncio.AbstractEventLoop]]:
+	"""Return uvloop's loop factory when available (it is POSIX-only)."""
+	if sys.platform == 'win32':
+		return None
+	try:
+		import uvloop
+	except ImportError:
+		return None
+	return uvloop.new_event_loop
+
+
 async def voice_loop(integration: BrowserUseIntegration) -> None:
 	"""Main voice interaction loop."""
 	LOGGER.info('\n' + '=' * 60)
@@ -137,7 +149,10 @@ async def main() -> None:
 
 if __name__ == '__main__':
 	try:
-		asyncio.run(main())
+		# A loop factory instead of uvloop.install(), whose global event loop
+		# policy is deprecated from Python 3.12
+		with asyncio.Runner(loop_factory=uvloop_factory()) as runner:
+			runner.run(main())
 	except KeyboardInterrupt:
 		LOGGER.info('\nInterrupted.')
 
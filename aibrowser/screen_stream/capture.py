@@ -5,11 +5,12 @@ from __future__ import annotations
 import asyncio
 import base64
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 
 import aiohttp
-from PIL import Image
-import io
+import av
+from av import VideoFrame
 
 from ..config import Config
 
@@ -35,7 +36,7 @@ class CDPScreenCapture:
             cdp_url: WebSocket URL for Chrome DevTools Protocol
             fps: Frames per second for capture (default from Config.SCREEN_STREAM_FPS)
             quality: JPEG quality 1-100 (default from Config.SCREEN_STREAM_QUALITY)
-            format: Image format 'jpeg' or 'png'
+            format: Screencast image format 'jpeg' or 'png'
             width: Frame width (default from Config.SCREEN_STREAM_WIDTH)
             height: Frame height (default from Config.SCREEN_STREAM_HEIGHT)
         """
@@ -46,11 +47,20 @@ class CDPScreenCapture:
         self._ws: Optional[aiohttp.ClientWebSocketResponse] = None
         self._session: Optional[aiohttp.ClientSession] = None
         self._running = False
-        # Buffer size based on FPS - keep ~2 seconds of frames
-        buffer_size = max(10, min(30, self.fps * 2))
-        self._frame_queue: asyncio.Queue = asyncio.Queue(maxsize=buffer_size)
+        # Keep at most two frames: when the sender stalls, stale frames are
+        # dropped instead of queuing up seconds of latency
+        self._frame_queue: asyncio.Queue = asyncio.Queue(maxsize=2)
+        self._dropped_frames = 0
         self._capture_task: Optional[asyncio.Task] = None
         self._message_id = 0
+        # Screencast frames arrive as JPEG; decoding them with the MJPEG codec
+        # yields yuvj420p frames the encoder can consume without an RGB hop.
+        self._decoder = av.CodecContext.create("mjpeg" if format == "jpeg" else "png", "r")
+        # Created in start() so a stopped capture can be started again
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._last_frame_time = 0.0
+        # Re-sent when the page is static and Chrome stops pushing frames
+        self._last_frame: Optional[VideoFrame] = None
         self._frame_width = width if width is not None else Config.SCREEN_STREAM_WIDTH
         self._frame_height = height if height is not None else Config.SCREEN_STREAM_HEIGHT
 
@@ -81,6 +91,10 @@ class CDPScreenCapture:
         
         self._ws = await self._session.ws_connect(self.cdp_url)
         self._running = True
+
+        # Decoding runs on a single worker thread so it never blocks the event
+        # loop; one worker also keeps the decoder context single-threaded
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="cdp-decode")
         
         # Set viewport size
         try:
@@ -97,6 +111,17 @@ class CDPScreenCapture:
         except Exception as e:
             logger.warning("Failed to set viewport size: %s (will use default)", e)
 
+        # Start the screencast; Chrome pushes Page.screencastFrame events
+        await self._send_command(
+            "Page.startScreencast",
+            {
+                "format": self.format,
+                "quality": self.quality if self.format == "jpeg" else None,
+                "maxWidth": self._frame_width,
+                "maxHeight": self._frame_height,
+            },
+        )
+
         # Start the capture loop
         self._capture_task = asyncio.create_task(self._capture_loop())
         logger.info("CDP screen capture started at %d FPS with quality %d", self.fps, self.quality)
@@ -108,6 +133,12 @@ class CDPScreenCapture:
 
         self._running = False
 
+        if self._ws and not self._ws.closed:
+            try:
+                await self._send_command("Page.stopScreencast")
+            except Exception as e:
+                logger.debug("Failed to stop screencast: %s", e)
+
         if self._capture_task:
             self._capture_task.cancel()
             try:
@@ -121,19 +152,34 @@ class CDPScreenCapture:
         if self._session:
             await self._session.close()
 
-        logger.info("CDP screen capture stopped")
+        if self._executor:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+        logger.info("CDP screen capture stopped (%d stale frames dropped)", self._dropped_frames)
 
-    async def get_frame(self) -> Optional[bytes]:
+    async def get_frame(self) -> Optional[VideoFrame]:
         """
-        Get the next frame as raw RGB bytes.
+        Get the next decoded frame.
 
         Returns:
-            RGB frame bytes or None if queue is empty
+            VideoFrame (yuvj420p for JPEG, rgb for PNG), the previous frame
+            if none arrived in time, or None if nothing has been captured yet
         """
+        # Chrome sends nothing while the page is static, so once there is a
+        # frame to repeat only wait one frame interval for a newer one
+        timeout = 2.0 if self._last_frame is None else 1.0 / self.fps
         try:
-            return await asyncio.wait_for(self._frame_queue.get(), timeout=2.0)
+            frame = await asyncio.wait_for(self._frame_queue.get(), timeout=timeout)
         except asyncio.TimeoutError:
-            return None
+            return self._last_frame
+
+        # Skip straight to the newest frame if the sender fell behind
+        while not self._frame_queue.empty():
+            frame = self._frame_queue.get_nowait()
+            self._dropped_frames += 1
+        self._last_frame = frame
+        return frame
 
     async def _send_command(self, method: str, params: dict = None) -> int:
         """Send a CDP command and return the message ID."""
@@ -147,40 +193,57 @@ class CDPScreenCapture:
         return self._message_id
 
     async def _capture_loop(self) -> None:
-        """Continuously capture screenshots at the specified FPS."""
+        """Consume screencast frames, throttled to the configured FPS."""
         interval = 1.0 / self.fps
+        loop = asyncio.get_running_loop()
+        # Newest frame held back by the FPS throttle
+        pending: Optional[str] = None
 
         while self._running:
             try:
-                # Request a screenshot
-                msg_id = await self._send_command(
-                    "Page.captureScreenshot",
-                    {
-                        "format": self.format,
-                        "quality": self.quality if self.format == "jpeg" else None,
-                    },
+                timeout = None
+                if pending is not None:
+                    # aiohttp treats a zero timeout as "use the default", so keep it positive
+                    timeout = max(0.001, self._last_frame_time + interval - loop.time())
+                try:
+                    msg = await self._ws.receive(timeout=timeout)
+                except asyncio.TimeoutError:
+                    # Nothing newer arrived in time, so the held frame is the
+                    # page's current state and must not be lost
+                    self._last_frame_time = loop.time()
+                    await self._publish_frame(loop, pending)
+                    pending = None
+                    continue
+
+                if msg.type in (aiohttp.WSMsgType.CLOSED, aiohttp.WSMsgType.ERROR):
+                    logger.error("WebSocket closed or error")
+                    break
+
+                if msg.type != aiohttp.WSMsgType.TEXT:
+                    continue
+
+                data = msg.json()
+                if data.get("method") != "Page.screencastFrame":
+                    continue
+
+                params = data.get("params", {})
+
+                # Chrome stops sending frames until the previous one is acked
+                await self._send_command(
+                    "Page.screencastFrameAck",
+                    {"sessionId": params.get("sessionId")},
                 )
 
-                # Wait for the response
-                frame_data = await self._wait_for_response(msg_id)
-                
-                if frame_data:
-                    # Convert base64 image to RGB bytes
-                    rgb_bytes = await self._decode_frame(frame_data)
-                    if rgb_bytes:
-                        # Non-blocking queue put
-                        if self._frame_queue.full():
-                            try:
-                                self._frame_queue.get_nowait()
-                            except asyncio.QueueEmpty:
-                                pass
-                        
-                        try:
-                            self._frame_queue.put_nowait(rgb_bytes)
-                        except asyncio.QueueFull:
-                            logger.debug("Frame queue full, dropping frame")
+                # Throttled frames replace the held one rather than being
+                # discarded, so the last repaint before the page settles is kept
+                pending = params.get("data")
+                now = loop.time()
+                if now - self._last_frame_time < interval:
+                    continue
+                self._last_frame_time = now
 
-                await asyncio.sleep(interval)
+                await self._publish_frame(loop, pending)
+                pending = None
 
             except asyncio.CancelledError:
                 break
@@ -188,50 +251,42 @@ class CDPScreenCapture:
                 logger.error("Error capturing frame: %s", error, exc_info=True)
                 await asyncio.sleep(interval)
 
-    async def _wait_for_response(self, msg_id: int, timeout: float = 5.0) -> Optional[str]:
-        """Wait for a CDP response with the given message ID."""
-        deadline = asyncio.get_event_loop().time() + timeout
+    async def _publish_frame(self, loop: asyncio.AbstractEventLoop, data: Optional[str]) -> None:
+        """Decode a screencast image and queue it, dropping the oldest queued frame."""
+        frame = await loop.run_in_executor(self._executor, self._decode_frame, data)
+        if frame is None:
+            return
 
-        while asyncio.get_event_loop().time() < deadline:
+        # Non-blocking queue put, dropping the oldest frame
+        if self._frame_queue.full():
             try:
-                msg = await asyncio.wait_for(self._ws.receive(), timeout=0.5)
-                
-                if msg.type == aiohttp.WSMsgType.TEXT:
-                    data = msg.json()
-                    if data.get("id") == msg_id:
-                        result = data.get("result", {})
-                        return result.get("data")
-                    
-                elif msg.type in (aiohttp.WSMsgType.CLOSED, aiohttp.WSMsgType.ERROR):
-                    logger.error("WebSocket closed or error")
-                    return None
+                self._frame_queue.get_nowait()
+                self._dropped_frames += 1
+            except asyncio.QueueEmpty:
+                pass
 
-            except asyncio.TimeoutError:
-                continue
-            except Exception as error:
-                logger.debug("Error reading WebSocket message: %s", error)
-                continue
+        try:
+            self._frame_queue.put_nowait(frame)
+        except asyncio.QueueFull:
+            logger.debug("Frame queue full, dropping frame")
 
-        return None
+    def _decode_frame(self, base64_data: Optional[str]) -> Optional[VideoFrame]:
+        """Decode a base64 screencast image straight to a VideoFrame (yuvj420p for JPEG, rgb for PNG)."""
+        if not base64_data:
+            return None
 
-    async def _decode_frame(self, base64_data: str) -> Optional[bytes]:
-        """Decode base64 image to RGB bytes."""
         try:
-            # Decode base64
-            img_bytes = base64.b64decode(base64_data)
-            
-            # Open with PIL
-            img = Image.open(io.BytesIO(img_bytes))
-            
+            packet = av.Packet(base64.b64decode(base64_data))
+            frames = self._decoder.decode(packet)
+            if not frames:
+                return None
+
+            frame = frames[-1]
+
             # Update frame size from actual image
-            self._frame_width, self._frame_height = img.size
-            
-            # Convert to RGB if needed
-            if img.mode != "RGB":
-                img = img.convert("RGB")
-            
-            # Return raw RGB bytes
-            return img.tobytes()
+            self._frame_width, self._frame_height = frame.width, frame.height
+
+            return frame
 
         except Exception as error:
             logger.error("Error decoding frame: %s", error)
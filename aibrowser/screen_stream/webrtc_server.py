@@ -4,17 +4,32 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import re
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 
 from aiortc import RTCPeerConnection, RTCSessionDescription, VideoStreamTrack, RTCConfiguration, RTCIceServer
 from av import VideoFrame
-import numpy as np
+from av.video.reformatter import VideoReformatter
 from aioice import Candidate as AioIceCandidate
 
 from .capture import CDPScreenCapture
 
 logger = logging.getLogger(__name__)
 
+_MEDIA_SECTION_RE = re.compile(r'^m=.*?(?=^m=|\Z)', re.MULTILINE | re.DOTALL)
+_DIR_RE = re.compile(r'^a=(?:sendrecv|recvonly|sendonly|inactive)\r?$', re.MULTILINE)
+
+
+def _add_missing_direction(match: re.Match) -> str:
+    """Append a=recvonly to a media section that lacks a direction attribute."""
+    section = match.group(0)
+    if _DIR_RE.search(section):
+        return section
+    if section.endswith('\n'):
+        return section + 'a=recvonly\r\n'
+    return section + '\r\na=recvonly'
+
 
 class BrowserVideoTrack(VideoStreamTrack):
     """Video track that streams frames from CDP screen capture."""
@@ -24,43 +39,57 @@ class BrowserVideoTrack(VideoStreamTrack):
     def __init__(self, capture: CDPScreenCapture) -> None:
         super().__init__()  # This initializes _start and other base attributes
         self.capture = capture
+        # Reused across frames so recv() doesn't allocate conversion helpers
+        # and blank frames on every call
+        self._reformatter = VideoReformatter()
+        self._blank: Optional[VideoFrame] = None
+        # Colour conversion runs off the event loop to keep RTP pacing steady
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="video-track")
+
+    def _blank_frame(self) -> VideoFrame:
+        """Return the cached blank frame, rebuilt only if the capture size changed."""
+        width, height = self.capture.frame_size
+        if self._blank is None or (self._blank.width, self._blank.height) != (width, height):
+            self._blank = VideoFrame(width=width, height=height, format="yuv420p")
+        return self._blank
 
     async def recv(self) -> VideoFrame:
         """Receive the next video frame."""
         pts, time_base = await self.next_timestamp()
 
-        # Get frame from capture
-        frame_bytes = await self.capture.get_frame()
-        
-        if frame_bytes is None:
-            # Return a blank frame if no data available
-            width, height = self.capture.frame_size
-            frame = VideoFrame(width=width, height=height, format="yuv420p")
-            frame.pts = pts
-            frame.time_base = time_base
-            return frame
-
-        # Convert RGB bytes to VideoFrame
-        width, height = self.capture.frame_size
-        
-        try:
-            # Create numpy array from RGB bytes
-            rgb_array = np.frombuffer(frame_bytes, dtype=np.uint8).reshape((height, width, 3))
-            
-            # Create VideoFrame from numpy array
-            frame = VideoFrame.from_ndarray(rgb_array, format="rgb24")
-            frame.pts = pts
-            frame.time_base = time_base
-            
-            return frame
-
-        except Exception as error:
-            logger.error("Error creating video frame: %s", error)
-            # Return blank frame on error
-            frame = VideoFrame(width=width, height=height, format="yuv420p")
-            frame.pts = pts
-            frame.time_base = time_base
-            return frame
+        # Fetched only once the frame is due, so the newest capture is sent;
+        # colour conversion still runs on the worker thread
+        frame = await self._fetch_frame()
+
+        if frame is None:
+            # Nothing captured yet; the capture repeats its last frame after that
+            frame = self._blank_frame()
+
+        frame.pts = pts
+        frame.time_base = time_base
+        return frame
+
+    async def _fetch_frame(self) -> Optional[VideoFrame]:
+        """Get the next captured frame, converted to yuv420p."""
+        # Capture already yields decoded YUV frames
+        frame = await self.capture.get_frame()
+
+        if frame is not None and frame.format.name != "yuv420p":
+            # Decoded JPEG is full-range yuvj420p; convert with the shared reformatter
+            frame = await asyncio.get_running_loop().run_in_executor(
+                self._executor, self._to_yuv420p, frame
+            )
+
+        return frame
+
+    def _to_yuv420p(self, frame: VideoFrame) -> VideoFrame:
+        """Convert a frame to yuv420p on the worker thread."""
+        return self._reformatter.reformat(frame, format="yuv420p")
+
+    def stop(self) -> None:
+        """Stop the track and release its worker thread."""
+        super().stop()
+        self._executor.shutdown(wait=False)
 
 
 class ScreenStreamSession:
@@ -80,6 +109,8 @@ class ScreenStreamSession:
         self.capture: Optional[CDPScreenCapture] = None
         self.video_track: Optional[BrowserVideoTrack] = None
         self._closed = False
+        # Serializes signaling on this session's peer connection only
+        self._lock = asyncio.Lock()
 
     async def create_answer(self, offer_sdp: str, offer_type: str) -> dict:
         """
@@ -153,44 +184,12 @@ class ScreenStreamSession:
         which causes aiortc to fail with "ValueError: None is not in list".
         This function ensures all media sections have proper direction attributes.
         """
-        lines = sdp.split('\r\n')
-        result = []
-        in_media_section = False
-        has_direction = False
-        media_type = None
-        
-        for i, line in enumerate(lines):
-            # Check if we're entering a new media section
-            if line.startswith('m='):
-                # If we were in a media section without direction, add recvonly
-                if in_media_section and not has_direction:
-                    result.append('a=recvonly')
-                
-                in_media_section = True
-                has_direction = False
-                media_type = line.split(' ')[0].replace('m=', '')
-                result.append(line)
-                continue
-            
-            # Check for direction attributes
-            if line.startswith('a=sendrecv') or line.startswith('a=recvonly') or \
-               line.startswith('a=sendonly') or line.startswith('a=inactive'):
-                has_direction = True
-                result.append(line)
-                continue
-            
-            # If we hit another media section or end, check if we need to add direction
-            if (line.startswith('m=') or i == len(lines) - 1) and in_media_section and not has_direction:
-                result.append('a=recvonly')
-                has_direction = True
-            
-            result.append(line)
-        
-        # Check the last media section
-        if in_media_section and not has_direction:
-            result.append('a=recvonly')
-        
-        return '\r\n'.join(result)
+        # Fast path: most browsers already give every media section a direction.
+        # Checked per section, since a total count can hide a section without one.
+        if all(_DIR_RE.search(section) for section in _MEDIA_SECTION_RE.findall(sdp)):
+            return sdp
+
+        return _MEDIA_SECTION_RE.sub(_add_missing_direction, sdp)
 
     async def add_ice_candidate(self, candidate: dict) -> None:
         """Add an ICE candidate to the peer connection."""
@@ -277,42 +276,57 @@ class ScreenStreamManager:
         offer_type: str,
     ) -> dict:
         """Create a new screen stream session and return the answer."""
+        # The manager lock only guards the dict; signaling runs under the
+        # session's own lock so unrelated sessions don't serialize
         async with self._lock:
-            # Close existing session if any
-            if session_id in self._sessions:
-                await self._sessions[session_id].close()
-                del self._sessions[session_id]
-
-            # Create new session
+            previous = self._sessions.pop(session_id, None)
             session = ScreenStreamSession(
                 session_id=session_id,
                 cdp_url=cdp_url,
                 ice_servers=self.ice_servers,
             )
-
-            answer = await session.create_answer(offer_sdp, offer_type)
+            # Locked before it is published, so ICE candidates that arrive
+            # while the previous session closes wait for the answer instead
+            # of being dropped against a missing peer connection
+            await session._lock.acquire()
             self._sessions[session_id] = session
 
-            return answer
+        try:
+            # Close existing session if any
+            if previous:
+                async with previous._lock:
+                    await previous.close()
+
+            return await session.create_answer(offer_sdp, offer_type)
+        except Exception:
+            async with self._lock:
+                if self._sessions.get(session_id) is session:
+                    del self._sessions[session_id]
+            await session.close()
+            raise
+        finally:
+            session._lock.release()
 
     async def add_ice_candidate(self, session_id: str, candidate: dict) -> None:
         """Add ICE candidate to a session."""
-        async with self._lock:
-            session = self._sessions.get(session_id)
-            if session:
+        session = self._sessions.get(session_id)
+        if session:
+            async with session._lock:
                 await session.add_ice_candidate(candidate)
 
     async def close_session(self, session_id: str) -> None:
         """Close a specific session."""
         async with self._lock:
             session = self._sessions.pop(session_id, None)
-            if session:
+        if session:
+            async with session._lock:
                 await session.close()
 
     async def close_all(self) -> None:
         """Close all sessions."""
         async with self._lock:
-            for session in self._sessions.values():
-                await session.close()
+            sessions = list(self._sessions.values())
             self._sessions.clear()
-
+        for session in sessions:
+            async with session._lock:
+                await session.close()
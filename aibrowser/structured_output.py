@@ -7,10 +7,13 @@ from dataclasses import dataclass, field
 from typing import Dict, List, Optional, Pattern
 
 SECTION_REGEX: Pattern[str] = re.compile(
-	r'^\s*(Narration|Action|Result|Thinking|Thought|Step|Evaluate|Action_Name|Action_Input)\s*[:\-]\s*(.*)$',
-	re.IGNORECASE,
+	r'^[ \t]*(Narration|Action|Result|Thinking|Thought|Step|Evaluate|Action_Name|Action_Input)[ \t]*[:\-][ \t]*(.*)$',
+	re.IGNORECASE | re.MULTILINE,
 )
 
+# A whitespace-only line terminates the section it follows.
+_BLANK_LINE_REGEX: Pattern[str] = re.compile(r'\n[^\S\n]*(?=\n|$)')
+
 
 @dataclass
 class StructuredAgentResponse:
@@ -31,46 +34,24 @@ class StructuredAgentResponse:
 		return None
 
 
-def _dedupe(values: List[str]) -> List[str]:
-	seen: set[str] = set()
-	order: List[str] = []
-	for value in values:
-		if value not in seen:
-			seen.add(value)
-			order.append(value)
-	return order
-
-
 def parse_sections(text: str, pattern: Pattern[str] = SECTION_REGEX) -> Dict[str, List[str]]:
+	"""Group section payloads by lowercased key; ``pattern`` must be line-anchored (MULTILINE)."""
 	sections: Dict[str, List[str]] = {}
-	current_key: Optional[str] = None
-	buffer: List[str] = []
-
-	def flush() -> None:
-		nonlocal buffer, current_key
-		if current_key and buffer:
-			content = ' '.join(part.strip() for part in buffer if part.strip())
-			if content:
-				sections.setdefault(current_key, []).append(content)
-		buffer = []
-
-	for raw_line in text.splitlines():
-		line = raw_line.strip()
-		if not line:
-			flush()
-			current_key = None
-			continue
-
-		match = pattern.match(line)
-		if match:
-			flush()
-			current_key = match.group(1).lower()
-			payload = match.group(2).strip()
-			buffer = [payload] if payload else []
-		elif current_key:
-			buffer.append(line)
-
-	flush()
+	matches = list(pattern.finditer(text))
+
+	for index, match in enumerate(matches):
+		body_end = matches[index + 1].start() if index + 1 < len(matches) else len(text)
+		body = text[match.end():body_end]
+		blank = _BLANK_LINE_REGEX.search(body)
+		if blank:
+			body = body[:blank.start()]
+
+		parts = [match.group(2).strip()]
+		parts.extend(line.strip() for line in body.strip().splitlines())
+		content = ' '.join(part for part in parts if part)
+		if content:
+			sections.setdefault(match.group(1).lower(), []).append(content)
+
 	return sections
 
 
@@ -103,7 +84,7 @@ def extract_narrations(text: str, pattern: Pattern[str] = SECTION_REGEX) -> List
 			if cleaned:
 				entries.append(cleaned)
 	if entries:
-		return _dedupe(entries)
+		return list(dict.fromkeys(entries))
 
 	lowered = text.lower()
 	tagged: List[str] = []
@@ -116,5 +97,5 @@ def extract_narrations(text: str, pattern: Pattern[str] = SECTION_REGEX) -> List
 			re.sub(r'^.*?\[(result|success)\]\s*', '', text, flags=re.IGNORECASE).strip()
 		)
 	tagged = [entry for entry in tagged if entry]
-	return _dedupe(entries + tagged) if tagged else _dedupe(entries)
+	return list(dict.fromkeys(entries + tagged))
 
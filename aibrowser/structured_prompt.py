@@ -2,12 +2,16 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
+from string import Formatter
+from typing import Optional, Tuple
 
 PROMPTS_DIR = Path(__file__).parent / 'prompts'
 
 
+@lru_cache(maxsize=32)
 def _load_template(name: str) -> str:
 	template_path = PROMPTS_DIR / name
 	if not template_path.exists():
@@ -15,10 +19,31 @@ def _load_template(name: str) -> str:
 	return template_path.read_text(encoding='utf-8')
 
 
+def _partial_format(template: str, **fixed: str) -> Tuple[Tuple[str, Optional[str]], ...]:
+	"""Pre-parse a format template into (literal, field) pieces, folding in fixed fields."""
+	pieces = []
+	literal = []
+	for text, name, _spec, _conversion in Formatter().parse(template):
+		literal.append(text)
+		if name is None:
+			continue
+		if name in fixed:
+			literal.append(fixed[name])
+		else:
+			pieces.append((''.join(literal), name))
+			literal = []
+	pieces.append((''.join(literal), None))
+	return tuple(pieces)
+
+
+def _render(pieces: Tuple[Tuple[str, Optional[str]], ...], **values: str) -> str:
+	return ''.join(text + values[name] if name else text for text, name in pieces)
+
+
 def _clean(text: str | None, fallback: str = '') -> str:
 	if not text:
 		return fallback
-	cleaned = str(text).strip()
+	cleaned = text.strip() if isinstance(text, str) else str(text).strip()
 	return cleaned or fallback
 
 
@@ -26,25 +51,34 @@ def _clean(text: str | None, fallback: str = '') -> str:
 class StructuredPromptBuilder:
 	base_prompt: str
 	search_engine: str
+	_prompt: str = field(init=False, repr=False)
 
-	def build(self) -> str:
+	def __post_init__(self) -> None:
+		# Every placeholder is fixed for the session, so render once up front
 		template = _load_template('system.md')
-		return template.format(
+		self._prompt = template.format(
 			search_engine=self.search_engine,
 			base_prompt_section=_clean(self.base_prompt),
 		).strip()
 
+	def build(self) -> str:
+		return self._prompt
+
 
 @dataclass
 class ObservationPromptBuilder:
 	search_engine: str
+	_pieces: Tuple[Tuple[str, Optional[str]], ...] = field(init=False, repr=False)
+
+	def __post_init__(self) -> None:
+		# search_engine is fixed for the session; only per-step fields stay open
+		self._pieces = _partial_format(_load_template('observation.md'), search_engine=self.search_engine)
 
 	def build(self, *, task: str, tab_summary: str, extra_context: str = '') -> str:
-		template = _load_template('observation.md')
-		return template.format(
+		return _render(
+			self._pieces,
 			task=_clean(task),
 			tab_summary=_clean(tab_summary, 'No active browser state available yet.'),
-			search_engine=self.search_engine,
 			extra_context=_clean(extra_context),
 		).strip()
 
@@ -52,12 +86,15 @@ class ObservationPromptBuilder:
 @dataclass
 class AnswerPromptBuilder:
 	template_name: str = 'answer.md'
+	_pieces: Tuple[Tuple[str, Optional[str]], ...] = field(init=False, repr=False)
+
+	def __post_init__(self) -> None:
+		self._pieces = _partial_format(_load_template(self.template_name))
 
 	def build(self, *, narration: str, action: str, result: str) -> str:
-		template = _load_template(self.template_name)
-		return template.format(
+		return _render(
+			self._pieces,
 			narration=_clean(narration),
 			action=_clean(action),
 			result=_clean(result),
 		).strip()
-
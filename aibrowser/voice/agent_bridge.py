@@ -3,8 +3,12 @@
 from __future__ import annotations
 
 import asyncio
+import functools
 import logging
-from typing import Callable, Optional
+import re
+import sys
+import time
+from typing import Awaitable, Callable, Optional
 
 from pipecat.frames.frames import TextFrame
 from pipecat.processors.frame_processor import FrameDirection
@@ -13,6 +17,93 @@ from ..browser_use_integration import BrowserUseIntegration
 
 logger = logging.getLogger(__name__)
 
+_DOWNSTREAM = FrameDirection.DOWNSTREAM
+# Narration that looks like JSON or raw element references isn't worth speaking
+_TECHNICAL_RE = re.compile(r'^[{\[]|index=', re.IGNORECASE)
+_PUNCT_TRANS = str.maketrans('', '', '.?!')
+_RULE = '-' * 70
+# Step banners are for someone watching a terminal; skip them under a supervisor
+_STDOUT_IS_TTY = sys.stdout is not None and sys.stdout.isatty()
+# Split after sentence punctuation, or after a clause break with 4+ words still to come
+_SENTENCE_BREAK_RE = re.compile(r'(?<=[.?!])\s+|(?<=[,;:])\s+(?=\S+\s+\S+\s+\S+\s+\S)')
+_MIN_CLAUSE_WORDS = 4
+_MAX_CHUNK_WORDS = 80
+_TTS_QUEUE_SIZE = 8
+# Messages that piled up while TTS was busy go out as one request, up to this many
+_TTS_BATCH_MAX = 4
+# A broken TTS endpoint fails every message; only log tracebacks this often
+_TTS_ERROR_TRACEBACK_INTERVAL = 5.0
+# How long stop() waits for the agent run to cancel and for the TTS worker to drain
+_TTS_STOP_TIMEOUT_SECONDS = 5.0
+_EXIT_WORDS = frozenset(('exit', 'quit', 'stop', 'goodbye'))
+_EXIT_WORD_MAX_LEN = max(map(len, _EXIT_WORDS))
+
+# Eager tasks (3.12+) run their synchronous prefix inline, e.g. a queue put
+_eager_task_factory = getattr(asyncio, 'eager_task_factory', None)
+
+
+def _create_task(coro) -> asyncio.Task:
+	"""Create a task, starting it eagerly when the running Python supports it."""
+	if _eager_task_factory is None:
+		return asyncio.create_task(coro)
+	return _eager_task_factory(asyncio.get_running_loop(), coro)
+
+
+def _as_async(callback: Optional[Callable]) -> Optional[Callable[..., Awaitable[None]]]:
+	"""Adapt a sync or async callback to a coroutine function."""
+	if callback is None or asyncio.iscoroutinefunction(callback):
+		return callback
+
+	async def call(*args) -> None:
+		callback(*args)
+
+	return call
+
+
+def _ellipsize(text: str, limit: int) -> str:
+	"""Truncate text for display, returning it unchanged when it already fits."""
+	return text if len(text) <= limit else f'{text[:limit]}...'
+
+
+def _write_lines(lines: list[str]) -> None:
+	"""Write terminal step output with a single write and flush."""
+	sys.stdout.write('\n'.join(lines) + '\n')
+	sys.stdout.flush()
+
+
+@functools.lru_cache(maxsize=128)
+def _narration_to_speech(narration: str) -> Optional[str]:
+	"""Strip sentence punctuation for TTS, keeping a single trailing period."""
+	stripped = narration.strip() if narration else ''
+	if not stripped:
+		return None
+	message = stripped.translate(_PUNCT_TRANS)
+	if stripped.endswith(('.', '?', '!')):
+		message += '.'
+	return message
+
+
+@functools.lru_cache(maxsize=128)
+def _speech_chunks(narration: str) -> tuple[str, ...]:
+	"""Split narration into sentence-sized TTS chunks so synthesis can start early."""
+	chunks = []
+	words: list[str] = []
+	for part in _SENTENCE_BREAK_RE.split(narration.strip()):
+		words.extend(part.split())
+		# Clause breaks only count once the clause is long enough to speak alone
+		if len(words) < _MIN_CLAUSE_WORDS and not part.endswith(('.', '?', '!')):
+			continue
+		for start in range(0, len(words), _MAX_CHUNK_WORDS):
+			chunk = _narration_to_speech(' '.join(words[start:start + _MAX_CHUNK_WORDS]))
+			if chunk:
+				chunks.append(chunk)
+		words = []
+	if words:
+		chunk = _narration_to_speech(' '.join(words))
+		if chunk:
+			chunks.append(chunk)
+	return tuple(chunks)
+
 
 class AgentBridge:
 	"""Bridges Pipecat text frames to browser agent."""
@@ -27,14 +118,28 @@ class AgentBridge:
 		self.integration = integration
 		self.on_user_speech = on_user_speech
 		self.on_agent_response = on_agent_response
+		# Classify sync/async callbacks once instead of on every call
+		self._on_user_speech_async = _as_async(on_user_speech)
+		self._on_agent_response_async = _as_async(on_agent_response)
 		self._processing = False
 		self._current_task: Optional[asyncio.Task] = None
+		self._current_query: Optional[str] = None
 		self._tts_processor = None
+		self._tts_send: Optional[Callable[[str], Awaitable[None]]] = None
 		self._speech_tracker = None
 		self._awaiting_user_input = False
-		self._tts_queue: asyncio.Queue = asyncio.Queue()
-		self._tts_processing = False
+		# Bounded so a burst of narration can't build up seconds of stale speech
+		self._tts_queue: asyncio.Queue = asyncio.Queue(maxsize=_TTS_QUEUE_SIZE)
+		self._tts_tail = ''
+		self._last_tts_error_ts = 0.0
 		self._tts_task: Optional[asyncio.Task] = None
+		# Set while stop() drains the queue, so new text can't push out the sentinel
+		self._tts_stopping = False
+		# Playback of the last step's narration, which overlaps its browser action
+		self._pending_speech: Optional[asyncio.Task] = None
+		# Per-run narration state, reset at the start of each _run_agent
+		self._last_tts_message = ''
+		self._step_counter = 0
 
 	async def process_user_text(self, text: str) -> None:
 		"""Process user speech transcript and run agent."""
@@ -44,10 +149,10 @@ class AgentBridge:
 			return
 
 		text = text.strip()
-		text_lower = text.lower()
 		logger.debug('Processing user speech: "%s"', text)
 		
-		if text_lower in {'exit', 'quit', 'stop', 'goodbye'}:
+		# Only short utterances can be exit commands; skip case-folding the rest
+		if len(text) <= _EXIT_WORD_MAX_LEN and text.casefold() in _EXIT_WORDS:
 			logger.info('User requested exit')
 			if self.on_user_speech:
 				try:
@@ -56,15 +161,18 @@ class AgentBridge:
 					logger.warning('Error in on_user_speech callback: %s', e)
 			return
 
+		# STT can finalize the same utterance twice; restarting the agent for
+		# an identical transcript would just repeat the LLM round-trip
+		if self._processing and self._current_query is not None and text.casefold() == self._current_query.casefold():
+			logger.info('Duplicate transcript while processing, ignored')
+			return
+
 		logger.debug('User speech received: "%s"', text)
 
-		if self.on_user_speech:
+		if self._on_user_speech_async:
 			try:
 				logger.debug('Calling on_user_speech callback with: "%s"', text)
-				if asyncio.iscoroutinefunction(self.on_user_speech):
-					await self.on_user_speech(text)
-				else:
-					self.on_user_speech(text)
+				await self._on_user_speech_async(text)
 				logger.debug('on_user_speech callback completed')
 			except Exception as e:
 				logger.warning('Error in on_user_speech callback: %s', e, exc_info=True)
@@ -80,217 +188,33 @@ class AgentBridge:
 					await self._current_task
 				except Exception as e:
 					logger.warning('Error waiting for previous task: %s', e)
-			else:
+			elif not self._current_task.done():
 				logger.info('Cancelling previous agent task due to new user input')
 				self._current_task.cancel()
-				try:
-					await self._current_task
-				except asyncio.CancelledError:
-					pass
+				# The old run must restore its callbacks and reset per-run state
+				# before the next one starts; asyncio.wait doesn't re-raise the
+				# task's CancelledError into this frame
+				await asyncio.wait({self._current_task})
 
 		self._processing = True
 		self._awaiting_user_input = False  # Reset flag when processing new input
-		self._current_task = asyncio.create_task(self._run_agent(text, is_continuation=is_continuation))
+		self._current_query = text
+		self._current_task = _create_task(self._run_agent(text, is_continuation=is_continuation))
 
 	async def _run_agent(self, query: str, *, is_continuation: bool = False) -> None:
 		"""Run agent and send responses to TTS."""
 		try:
-			def narration_callback(narration: str) -> None:
-				pass
-
-			_last_tts_message = ''
-			_step_counter = 0
-			
-			async def step_callback(step: int, reasoning: str, narration: str, tool: str, phase: str) -> None:
-				"""Handle step callbacks with conversational narration."""
-				nonlocal _last_tts_message, _step_counter, query
-				
-				def tool_to_natural(t: str) -> str:
-					if not t or not t.strip():
-						return ''
-					t_lower = t.lower().strip()
-					if t_lower.startswith('search('):
-						try:
-							query_start = t_lower.find("query='") + 7
-							query_end = t_lower.find("'", query_start)
-							if query_end > query_start:
-								query = t_lower[query_start:query_end]
-								return f"searching for '{query}'"
-						except:
-							pass
-						return "searching"
-					elif t_lower.startswith('navigate('):
-						try:
-							url_start = t_lower.find("url='") + 5
-							url_end = t_lower.find("'", url_start)
-							if url_end > url_start:
-								url = t_lower[url_start:url_end]
-								if '//' in url:
-									domain = url.split('//')[-1].split('/')[0]
-									return f"navigating to {domain}"
-						except:
-							pass
-						return "navigating to a webpage"
-					elif t_lower.startswith('click('):
-						if 'index=' in t_lower:
-							try:
-								idx_start = t_lower.find("index=") + 6
-								idx_end = t_lower.find(',', idx_start)
-								if idx_end == -1:
-									idx_end = t_lower.find(')', idx_start)
-								if idx_end > idx_start:
-									idx = t_lower[idx_start:idx_end].strip()
-									return f"clicking on element {idx}"
-							except:
-								pass
-						return "clicking on the page"
-					elif t_lower.startswith('input('):
-						try:
-							text_start = t_lower.find("text='") + 6
-							text_end = t_lower.find("'", text_start)
-							if text_end > text_start:
-								text = t_lower[text_start:text_end]
-								text_preview = text[:20] + '...' if len(text) > 20 else text
-								return f"typing '{text_preview}'"
-						except:
-							pass
-						return "typing text"
-					elif t_lower.startswith('scroll('):
-						if 'direction=' in t_lower:
-							try:
-								dir_start = t_lower.find("direction='") + 11
-								dir_end = t_lower.find("'", dir_start)
-								if dir_end > dir_start:
-									direction = t_lower[dir_start:dir_end]
-									return f"scrolling {direction}"
-							except:
-								pass
-						return "scrolling the page"
-					elif t_lower.startswith('send_keys('):
-						return "pressing keys"
-					elif t_lower.startswith('screenshot('):
-						return "taking a screenshot"
-					return t_lower.replace('_', ' ').replace('()', '')
-				
-				# Print step information to terminal
-				if phase == 'before':
-					_step_counter += 1
-					print(f'\n{"-"*70}')
-					print(f'Step {step}')
-					print(f'{"-"*70}')
-					
-					if reasoning and reasoning.strip():
-						reasoning_display = reasoning[:300] + '...' if len(reasoning) > 300 else reasoning
-						print(f'Reasoning: {reasoning_display}')
-					else:
-						print('Reasoning: (analyzing current state)')
-					
-					if narration and narration.strip():
-						print(f'Response (before action): {narration}')
-					else:
-						print('Response (before action): (preparing to act)')
-					
-					if tool and tool.strip():
-						print(f'Action/Tool: {tool}')
-					else:
-						print('Action/Tool: (none)')
-					
-					message = None
-					
-					if narration and narration.strip():
-						message = narration.strip().replace('.', '').replace('?', '').replace('!', '')
-						if narration.strip()[-1] in '.?!':
-							message += '.'
-					
-					if message and message != _last_tts_message:
-						if not (message.startswith('{') or message.startswith('[') or 'index=' in message.lower()):
-							logger.debug(f'Step {step} (before): {message}')
-							_last_tts_message = message
-							
-							# Send TTS (audio will stream to frontend and play there)
-							await self._send_to_tts(message)
-							
-							# Wait for speech to complete before executing the action
-							if self._speech_tracker:
-								logger.debug(f'Waiting for speech to complete before executing action...')
-								await self._speech_tracker.wait_for_speech_completion(timeout=30.0)
-								logger.debug(f'Speech completed, proceeding with action execution')
-							else:
-								logger.warning('No speech tracker available, proceeding immediately')
-					
-					return
-				elif phase == 'after':
-					if narration and narration.strip():
-						print(f'Response (after action): {narration}')
-					
-					if tool and tool.strip():
-						if ' → ' in tool:
-							result_part = tool.split(' → ', 1)[1]
-							result_display = result_part[:200] + '...' if len(result_part) > 200 else result_part
-							print(f'Action Result: {result_display}')
-						else:
-							result_display = tool[:200] + '...' if len(tool) > 200 else tool
-							print(f'Action Result: {result_display}')
-					
-					print(f'{"-"*70}')
-					
-					if tool and 'Task completed' in tool:
-						if _step_counter <= 1:
-							logger.debug(
-								'Task completed but only one step detected; skipping after-phase TTS to keep single-step responses brief'
-							)
-							return
-						logger.debug(f'Task completed detected, tool="{tool}", narration="{narration}"')
-						message = None
-						
-						if narration and narration.strip():
-							message = narration.strip().replace('.', '').replace('?', '').replace('!', '')
-							if narration.strip()[-1] in '.?!':
-								message += '.'
-						
-						logger.debug(f'Processed message="{message}", last_message="{_last_tts_message}", are_equal={message == _last_tts_message if message else False}')
-						
-						if message and message != _last_tts_message:
-							if not (message.startswith('{') or message.startswith('[') or 'index=' in message.lower()):
-								logger.debug(f'Step {step} (after - task completed): {message}')
-								old_last_message = _last_tts_message
-								_last_tts_message = message
-								logger.debug(f'About to send TTS message: "{message}"')
-								try:
-									# Send TTS async - don't wait for it to complete
-									# Audio is streamed to frontend, so we can't track local completion
-									asyncio.create_task(self._send_to_tts(message))
-									logger.debug(f'TTS message sent successfully')
-								except Exception as e:
-									logger.error(f'Error sending TTS message: {e}', exc_info=True)
-							else:
-								logger.debug(f'Message filtered out due to JSON/technical content: "{message}"')
-						else:
-							logger.debug(f'Message not sent: message={message is not None}, different={message != _last_tts_message if message else False}')
-					else:
-						logger.debug(f'Not a task completion step: tool="{tool}"')
+			self._last_tts_message = ''
+			self._step_counter = 0
+			self._tts_tail = ''
 
 			original_narration = self.integration.narration_callback
 			original_step = self.integration.step_callback
 
-			# Create a chained step callback that calls both original and TTS callback
-			async def chained_step_callback(step: int, reasoning: str, narration: str, tool: str, phase: str) -> None:
-				# First call the original step callback (for WebSocket updates)
-				if original_step:
-					try:
-						if asyncio.iscoroutinefunction(original_step):
-							await original_step(step, reasoning, narration, tool, phase)
-						else:
-							original_step(step, reasoning, narration, tool, phase)
-					except Exception as e:
-						logger.debug('Error in original step callback: %s', e)
-				
-				# Then call the TTS step callback
-				await step_callback(step, reasoning, narration, tool, phase)
-
+			# Chain the original (WebSocket) step callback with the TTS one
 			self.integration.update_callbacks(
-				narration_callback=narration_callback,
-				step_callback=chained_step_callback,
+				narration_callback=self._ignore_narration,
+				step_callback=functools.partial(self._chained_step_callback, _as_async(original_step)),
 			)
 
 			try:
@@ -299,14 +223,11 @@ class AgentBridge:
 				# Track if agent is awaiting user input
 				self._awaiting_user_input = result.get('awaiting_user_input', False)
 
-				if self.on_agent_response:
+				if self._on_agent_response_async:
 					try:
 						response_text = result.get('message', '')
 						logger.debug('Calling on_agent_response callback with: "%s"', response_text)
-						if asyncio.iscoroutinefunction(self.on_agent_response):
-							await self.on_agent_response(response_text)
-						else:
-							self.on_agent_response(response_text)
+						await self._on_agent_response_async(response_text)
 						logger.debug('on_agent_response callback completed')
 					except Exception as e:
 						logger.warning('Error in on_agent_response callback: %s', e, exc_info=True)
@@ -329,70 +250,286 @@ class AgentBridge:
 			await self._send_to_tts(error_msg)
 		finally:
 			self._processing = False
+			self._current_query = None
+			if self._pending_speech is not None:
+				self._pending_speech.cancel()
+				self._pending_speech = None
+
+	@staticmethod
+	def _ignore_narration(narration: str) -> None:
+		pass
+
+	async def _chained_step_callback(
+		self,
+		original_step,
+		step: int,
+		reasoning: str,
+		narration: str,
+		tool: str,
+		phase: str,
+	) -> None:
+		"""Call the original step callback and then the TTS step callback."""
+		# First call the original step callback (for WebSocket updates)
+		if original_step:
+			try:
+				await original_step(step, reasoning, narration, tool, phase)
+			except Exception as e:
+				logger.debug('Error in original step callback: %s', e)
+
+		# Then call the TTS step callback
+		await self._step_callback(step, reasoning, narration, tool, phase)
+
+	async def _step_callback(self, step: int, reasoning: str, narration: str, tool: str, phase: str) -> None:
+		"""Handle step callbacks with conversational narration."""
+		# Print step information to terminal
+		if phase == 'before':
+			self._step_counter += 1
+			# Skip formatting step banners entirely when nobody is watching a terminal
+			if _STDOUT_IS_TTY:
+				lines = ['', _RULE, f'Step {step}', _RULE]
+				
+				if reasoning and reasoning.strip():
+					lines.append(f'Reasoning: {_ellipsize(reasoning, 300)}')
+				else:
+					lines.append('Reasoning: (analyzing current state)')
+				
+				if narration and narration.strip():
+					lines.append(f'Response (before action): {narration}')
+				else:
+					lines.append('Response (before action): (preparing to act)')
+				
+				if tool and tool.strip():
+					lines.append(f'Action/Tool: {tool}')
+				else:
+					lines.append('Action/Tool: (none)')
+				
+				# One write per phase instead of a print() per line
+				_write_lines(lines)
+			
+			message = _narration_to_speech(narration)
+			
+			if message and message != self._last_tts_message and not _TECHNICAL_RE.search(message):
+				logger.debug('Step %s (before): %s', step, message)
+				self._last_tts_message = message
+				
+				# Let the previous step's narration finish so speech stays in order
+				if self._pending_speech is not None:
+					await self._pending_speech
+					self._pending_speech = None
+				
+				# Queue sentence by sentence so TTS starts on the first one while
+				# the rest are still pending; the single worker keeps them in order
+				queued = False
+				for chunk in _speech_chunks(narration):
+					queued = self._enqueue_tts(chunk) or queued
+				
+				# Track playback in the background so the browser action runs
+				# while the narration is being spoken; with nothing queued there
+				# is no playback to wait for
+				if not queued:
+					logger.debug('Step %s narration not queued, no playback to track', step)
+				elif self._speech_tracker:
+					self._pending_speech = _create_task(
+						self._speech_tracker.wait_for_speech_completion(timeout=30.0)
+					)
+				else:
+					logger.warning('No speech tracker available, proceeding immediately')
+			
+			return
+		elif phase == 'after':
+			if _STDOUT_IS_TTY:
+				lines = []
+				if narration and narration.strip():
+					lines.append(f'Response (after action): {narration}')
+				
+				if tool and tool.strip():
+					if ' → ' in tool:
+						result_part = tool.split(' → ', 1)[1]
+						lines.append(f'Action Result: {_ellipsize(result_part, 200)}')
+					else:
+						lines.append(f'Action Result: {_ellipsize(tool, 200)}')
+				
+				lines.append(_RULE)
+				_write_lines(lines)
+			
+			if tool and 'Task completed' in tool:
+				if self._step_counter <= 1:
+					logger.debug(
+						'Task completed but only one step detected; skipping after-phase TTS to keep single-step responses brief'
+					)
+					return
+				logger.debug('Task completed detected, tool="%s", narration="%s"', tool, narration)
+				message = _narration_to_speech(narration)
+				
+				if logger.isEnabledFor(logging.DEBUG):
+					logger.debug(
+						'Processed message="%s", last_message="%s", are_equal=%s',
+						message, self._last_tts_message, message == self._last_tts_message if message else False,
+					)
+				
+				if message and message != self._last_tts_message:
+					if not _TECHNICAL_RE.search(message):
+						logger.debug('Step %s (after - task completed): %s', step, message)
+						old_last_message = self._last_tts_message
+						self._last_tts_message = message
+						logger.debug('About to send TTS message: "%s"', message)
+						try:
+							# Send TTS async - don't wait for it to complete
+							# Audio is streamed to frontend, so we can't track local completion
+							self._enqueue_tts(message)
+							logger.debug('TTS message sent successfully')
+						except Exception as e:
+							self._log_tts_error('Error sending TTS message: %s', e)
+					else:
+						logger.debug('Message filtered out due to JSON/technical content: "%s"', message)
+				else:
+					if logger.isEnabledFor(logging.DEBUG):
+						logger.debug(
+							'Message not sent: message=%s, different=%s',
+							message is not None, message != self._last_tts_message if message else False,
+						)
+			else:
+				logger.debug('Not a task completion step: tool="%s"', tool)
 
 	def set_tts_processor(self, processor) -> None:
 		self._tts_processor = processor
+		# Resolve the send path once instead of probing the processor per message
+		if processor is None:
+			self._tts_send = None
+		elif hasattr(processor, 'send_text'):
+			self._tts_send = processor.send_text
+		else:
+			self._tts_send = functools.partial(self._push_text_frame, processor)
+
+	@staticmethod
+	async def _push_text_frame(processor, text: str) -> None:
+		await processor.push_frame(TextFrame(text=text), _DOWNSTREAM)
 	
 	def set_speech_tracker(self, tracker) -> None:
 		self._speech_tracker = tracker
 
-	async def _send_to_tts(self, text: str) -> None:
-		"""Queue text for TTS processing."""
-		if not text or not text.strip():
-			logger.debug('_send_to_tts: Empty text, skipping')
-			return
+	def _enqueue_tts(self, text: str) -> bool:
+		"""Queue text for TTS processing without creating a task per message; False if skipped."""
+		text = text.strip() if text else ''
+		if not text:
+			logger.debug('_enqueue_tts: Empty text, skipping')
+			return False
 		
 		if not self._tts_processor:
-			logger.warning('_send_to_tts: No TTS processor set')
-			return
+			logger.warning('_enqueue_tts: No TTS processor set')
+			return False
 		
-		text = text.strip()
-		logger.debug(f'_send_to_tts: Queuing text for TTS: "{text[:100]}{"..." if len(text) > 100 else ""}"')
+		if self._tts_stopping:
+			logger.debug('_enqueue_tts: TTS worker stopping, skipping')
+			return False
+		
+		# Coalesce exact repeats of the last queued message
+		if text == self._tts_tail:
+			logger.debug('_enqueue_tts: Duplicate of last queued message, skipping')
+			return False
+		self._tts_tail = text
+		
+		if logger.isEnabledFor(logging.DEBUG):
+			logger.debug('_enqueue_tts: Queuing text for TTS: "%s"', _ellipsize(text, 100))
 		
-		# Queue the text for sequential processing
-		await self._tts_queue.put(text)
+		# Queue the text for sequential processing, dropping the oldest when full
+		if self._tts_queue.full():
+			try:
+				self._tts_queue.get_nowait()
+				self._tts_queue.task_done()
+				logger.debug('_enqueue_tts: TTS queue full, dropped oldest message')
+			except asyncio.QueueEmpty:
+				pass
+		self._tts_queue.put_nowait(text)
 		
 		# Start TTS processing task if not already running
-		if not self._tts_processing:
-			self._tts_processing = True
-			if self._tts_task and not self._tts_task.done():
-				self._tts_task.cancel()
-			self._tts_task = asyncio.create_task(self._process_tts_queue())
+		if self._tts_task is None or self._tts_task.done():
+			self._tts_task = _create_task(self._process_tts_queue())
+		return True
+
+	async def _send_to_tts(self, text: str) -> None:
+		"""Queue text for TTS processing from contexts that expect a coroutine."""
+		self._enqueue_tts(text)
 	
 	async def _process_tts_queue(self) -> None:
-		"""Process TTS queue sequentially."""
+		"""Process TTS queue sequentially until the shutdown sentinel arrives."""
 		try:
-			while True:
-				try:
-					# Get next text from queue (with timeout to allow cancellation)
-					text = await asyncio.wait_for(self._tts_queue.get(), timeout=1.0)
-					
-					logger.debug(f'_process_tts_queue: Processing TTS: "{text[:100]}{"..." if len(text) > 100 else ""}"')
-					
-					try:
-						if hasattr(self._tts_processor, 'send_text'):
-							await self._tts_processor.send_text(text)
-						else:
-							from pipecat.frames.frames import TextFrame
-							await self._tts_processor.push_frame(TextFrame(text=text), FrameDirection.DOWNSTREAM)
-						
-						logger.debug(f'_process_tts_queue: TTS sent successfully')
-					except Exception as e:
-						logger.error('Error sending text to TTS: %s', e, exc_info=True)
-					
-					# Mark task as done
+			stopping = False
+			while not stopping:
+				text = await self._tts_queue.get()
+				if text is None:
 					self._tts_queue.task_done()
-					
-				except asyncio.TimeoutError:
-					# Check if queue is empty and we should stop
-					if self._tts_queue.empty():
+					break
+				
+				# Coalesce whatever queued up during the previous send; the first
+				# message is never held back waiting for company
+				batch = [text]
+				while len(batch) < _TTS_BATCH_MAX and not self._tts_queue.empty():
+					queued = self._tts_queue.get_nowait()
+					self._tts_queue.task_done()
+					if queued is None:
+						stopping = True
 						break
-					continue
+					batch.append(queued)
+				if len(batch) > 1:
+					text = ' '.join(batch)
+				
+				if logger.isEnabledFor(logging.DEBUG):
+					logger.debug('_process_tts_queue: Processing TTS: "%s"', _ellipsize(text, 100))
+				
+				try:
+					await self._tts_send(text)
+					
+					logger.debug('_process_tts_queue: TTS sent successfully')
+				except Exception as e:
+					self._log_tts_error('Error sending text to TTS: %s', e)
+				
+				# Mark task as done
+				self._tts_queue.task_done()
 		except asyncio.CancelledError:
 			logger.debug('TTS queue processing cancelled')
 			raise
-		finally:
-			self._tts_processing = False
+
+	def _log_tts_error(self, msg: str, error: Exception) -> None:
+		"""Log a TTS failure, including the traceback at most once per interval."""
+		now = time.monotonic()
+		if now - self._last_tts_error_ts > _TTS_ERROR_TRACEBACK_INTERVAL:
+			self._last_tts_error_ts = now
+			logger.error(msg, error, exc_info=True)
+		else:
+			logger.warning(msg, error)
+
+	async def stop(self) -> None:
+		"""Cancel the agent run, then stop the TTS worker once it has drained the queued messages."""
+		if self._current_task is not None and not self._current_task.done():
+			self._current_task.cancel()
+			# Bounded too: a run stuck in a browser call can ignore cancellation,
+			# and callers may hold a lock other connections are waiting on
+			_, pending = await asyncio.wait({self._current_task}, timeout=_TTS_STOP_TIMEOUT_SECONDS)
+			if pending:
+				logger.warning('Agent task still running after cancellation, continuing shutdown')
+
+		if self._tts_task is None or self._tts_task.done():
+			return
+		self._tts_stopping = True
+		try:
+			# put() waits for room rather than dropping anything, and nothing
+			# can be queued behind the sentinel while stopping
+			await asyncio.wait_for(self._tts_queue.put(None), timeout=_TTS_STOP_TIMEOUT_SECONDS)
+			_, pending = await asyncio.wait({self._tts_task}, timeout=_TTS_STOP_TIMEOUT_SECONDS)
+		except asyncio.TimeoutError:
+			pending = {self._tts_task}
+		if pending:
+			logger.warning('TTS worker did not drain in time, cancelling it')
+			self._tts_task.cancel()
+			await asyncio.wait({self._tts_task})
+			# Don't leave stale messages or the sentinel for the next worker
+			while not self._tts_queue.empty():
+				self._tts_queue.get_nowait()
+				self._tts_queue.task_done()
+		self._tts_task = None
+		self._tts_tail = ''
+		self._tts_stopping = False
 
 	def is_processing(self) -> bool:
 		return self._processing
@@ -4,31 +4,69 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from typing import Optional
+import time
+from typing import TYPE_CHECKING, Optional
 
-from pipecat.frames.frames import TextFrame, StartFrame, TranscriptionFrame, InterimTranscriptionFrame, BotStartedSpeakingFrame, BotStoppedSpeakingFrame, TTSAudioRawFrame, UserStartedSpeakingFrame, InterruptionFrame
+from pipecat.frames.frames import TextFrame, InputAudioRawFrame, TranscriptionFrame, InterimTranscriptionFrame, BotStartedSpeakingFrame, BotStoppedSpeakingFrame, TTSAudioRawFrame, UserStartedSpeakingFrame, UserStoppedSpeakingFrame, InterruptionFrame
 from pipecat.processors.frame_processor import FrameProcessor, FrameDirection
 from pipecat.pipeline.pipeline import Pipeline
 from pipecat.pipeline.runner import PipelineRunner
 from pipecat.pipeline.task import PipelineTask
-from pipecat.audio.vad.silero import SileroVADAnalyzer
-from pipecat.audio.vad.vad_analyzer import VADParams
-from pipecat.services.deepgram.stt import DeepgramSTTService
 import base64
 
-try:
-	from deepgram import LiveOptions
-except ImportError:
-	LiveOptions = None
-from pipecat.services.elevenlabs.tts import ElevenLabsTTSService
-from pipecat.transports.local.audio import LocalAudioTransport, LocalAudioTransportParams
-
 from .agent_bridge import AgentBridge
 
+if TYPE_CHECKING:
+	from pipecat.transports.local.audio import LocalAudioTransport
+
 logger = logging.getLogger(__name__)
 
 USER_SILENCE_DELAY_SECONDS = 1.0
 TEXT_TO_AGENT_BUFFER_DELAY_SECONDS = 0.05
+# Utterances waiting for the agent bridge; older ones are dropped past this
+TEXT_TO_AGENT_QUEUE_SIZE = 4
+
+
+def _log_audio_input_devices() -> None:
+	"""List audio input devices and fixes after a device error (blocking PyAudio calls)."""
+	try:
+		import pyaudio
+		pa = pyaudio.PyAudio()
+		logger.debug('Available audio input devices:')
+		has_input = False
+		for i in range(pa.get_device_count()):
+			info = pa.get_device_info_by_index(i)
+			if info['maxInputChannels'] > 0:
+				has_input = True
+				default_str = ' (DEFAULT)' if i == pa.get_default_input_device_info()['index'] else ''
+				logger.info(
+					'  Device %d: %s (channels: %d)%s',
+					i,
+					info['name'],
+					info['maxInputChannels'],
+					default_str,
+				)
+		pa.terminate()
+		
+		if not has_input:
+			logger.error(
+				'No audio input devices found!\n'
+				'Solutions:\n'
+				'  1. Check that a microphone is connected\n'
+				'  2. Check Windows microphone permissions (Settings > Privacy > Microphone)\n'
+				'  3. Ensure no other application is using the microphone\n'
+				'  4. Update audio drivers'
+			)
+		else:
+			logger.error(
+				'Solutions:\n'
+				'  1. Check Windows microphone permissions (Settings > Privacy > Microphone)\n'
+				'  2. Ensure no other application is using the microphone\n'
+				'  3. Try closing and reopening the application\n'
+				'  4. Restart your computer if the issue persists'
+			)
+	except Exception as list_error:
+		logger.warning('Could not list audio devices: %s', list_error)
 
 
 class TextToAgentProcessor(FrameProcessor):
@@ -42,16 +80,27 @@ class TextToAgentProcessor(FrameProcessor):
 		self._last_final_text: Optional[str] = None
 		self._transcription_timer: Optional[asyncio.Task] = None
 		self._last_interim_text: Optional[str] = None
+		# One consumer hands utterances to the bridge in order
+		self._text_queue: asyncio.Queue = asyncio.Queue(maxsize=TEXT_TO_AGENT_QUEUE_SIZE)
+		self._consumer_task: Optional[asyncio.Task] = None
+		# VAD end-of-speech time, for measuring how long dispatch to the agent takes
+		self._speech_end_time: Optional[float] = None
 
 	async def process_frame(self, frame, direction: FrameDirection) -> None:
 		"""Process text frames from STT."""
-		if isinstance(frame, StartFrame):
-			await super().process_frame(frame, direction)
+		await super().process_frame(frame, direction)
+		
+		# Audio dominates the frame stream; only transcriptions need handling
+		if not isinstance(frame, TextFrame):
+			# Microphone audio has been consumed by STT; nothing past this point
+			# (TTS, audio streaming, output transport) uses it
+			if isinstance(frame, InputAudioRawFrame):
+				return
+			if isinstance(frame, UserStoppedSpeakingFrame):
+				self._speech_end_time = time.monotonic()
 			await self.push_frame(frame, direction)
 			return
 		
-		await super().process_frame(frame, direction)
-		
 		if isinstance(frame, InterimTranscriptionFrame) and frame.text:
 			interim_text = frame.text.strip()
 			if interim_text:
@@ -61,6 +110,9 @@ class TextToAgentProcessor(FrameProcessor):
 					self._transcription_timer.cancel()
 					self._transcription_timer = None
 					logger.debug('Cancelled pending transcription timer - user still speaking')
+			# Transcripts end here; the agent gets them through the bridge and
+			# nothing downstream (TTS, audio streaming, output) uses them
+			return
 		
 		elif isinstance(frame, TranscriptionFrame) and frame.text:
 			text = frame.text.strip()
@@ -91,6 +143,7 @@ class TextToAgentProcessor(FrameProcessor):
 				self._transcription_timer = asyncio.create_task(
 					self._process_transcription_after_silence()
 				)
+			return
 		
 		await self.push_frame(frame, direction)
 	
@@ -125,11 +178,45 @@ class TextToAgentProcessor(FrameProcessor):
 		full_text = self._merge_transcription_chunks(self._accumulated_transcription)
 		
 		if full_text and full_text.strip():
-			logger.info('Heard: "%s"', full_text)
+			if self._speech_end_time is not None:
+				latency_ms = (time.monotonic() - self._speech_end_time) * 1000
+				self._speech_end_time = None
+				logger.info('Heard: "%s" (%.0f ms after end of speech)', full_text, latency_ms)
+			else:
+				logger.info('Heard: "%s"', full_text)
 			self._accumulated_transcription.clear()
 			self._last_final_text = None
 			self._last_interim_text = None
-			asyncio.create_task(self.agent_bridge.process_user_text(full_text))
+			if self._text_queue.full():
+				try:
+					self._text_queue.get_nowait()
+					logger.warning('Agent backlog full, dropping oldest utterance')
+				except asyncio.QueueEmpty:
+					pass
+			self._text_queue.put_nowait(full_text)
+			if self._consumer_task is None or self._consumer_task.done():
+				self._consumer_task = asyncio.create_task(self._consume_transcriptions())
+	
+	async def _consume_transcriptions(self) -> None:
+		"""Forward queued utterances to the agent bridge one at a time."""
+		while True:
+			text = await self._text_queue.get()
+			try:
+				await self.agent_bridge.process_user_text(text)
+			except Exception as e:
+				logger.error('Error sending transcription to agent: %s', e, exc_info=True)
+	
+	async def aclose(self) -> None:
+		"""Stop the utterance consumer and any pending silence timer."""
+		for task in (self._consumer_task, self._transcription_timer):
+			if task and not task.done():
+				task.cancel()
+				try:
+					await task
+				except asyncio.CancelledError:
+					pass
+		self._consumer_task = None
+		self._transcription_timer = None
 	
 	def _merge_transcription_chunks(self, chunks: list[str]) -> str:
 		"""Merge transcription chunks handling overlaps."""
@@ -239,7 +326,7 @@ class SpeechCompletionTracker(FrameProcessor):
 		if isinstance(frame, BotStartedSpeakingFrame):
 			self._is_speaking = True
 			self._speech_chunk_count += 1
-			logger.debug(f'Bot started speaking (chunk {self._speech_chunk_count})')
+			logger.debug('Bot started speaking (chunk %d)', self._speech_chunk_count)
 			if self._speech_silence_timer and not self._speech_silence_timer.done():
 				self._speech_silence_timer.cancel()
 			self._speech_silence_timer = None
@@ -250,7 +337,7 @@ class SpeechCompletionTracker(FrameProcessor):
 				self._speech_start_futures.clear()
 		elif isinstance(frame, BotStoppedSpeakingFrame):
 			self._speech_chunk_count = max(0, self._speech_chunk_count - 1)
-			logger.debug(f'Bot stopped speaking (remaining chunks: {self._speech_chunk_count})')
+			logger.debug('Bot stopped speaking (remaining chunks: %d)', self._speech_chunk_count)
 			
 			if self._speech_chunk_count == 0:
 				self._is_speaking = False
@@ -325,29 +412,23 @@ class AgentToTTSProcessor(FrameProcessor):
 
 	async def send_text(self, text: str) -> None:
 		"""Send text to TTS by pushing TextFrame into pipeline."""
-		if not text or not text.strip():
+		text_clean = text.strip() if text else ''
+		if not text_clean:
 			logger.debug('AgentToTTSProcessor.send_text: Empty text, skipping')
 			return
 		
-		text_clean = text.strip()
 		logger.debug('AgentToTTSProcessor.send_text: Sending text to TTS: "%s"', text_clean)
 		
 		try:
-			logger.debug(f'AgentToTTSProcessor.send_text: Pushing TextFrame with text="{text_clean[:100]}{"..." if len(text_clean) > 100 else ""}"')
 			text_frame = TextFrame(text=text_clean)
 			await self.push_frame(text_frame, FrameDirection.DOWNSTREAM)
-			logger.debug(f'AgentToTTSProcessor.send_text: TextFrame pushed successfully')
+			logger.debug('AgentToTTSProcessor.send_text: TextFrame pushed successfully')
 		except Exception as e:
 			logger.error('Error pushing TextFrame to pipeline: %s', e, exc_info=True)
 			raise  # Re-raise to see the full error
 
 	async def process_frame(self, frame, direction: FrameDirection) -> None:
 		"""Process frames and pass everything through."""
-		if isinstance(frame, StartFrame):
-			await super().process_frame(frame, direction)
-			await self.push_frame(frame, direction)
-			return
-		
 		await super().process_frame(frame, direction)
 		await self.push_frame(frame, direction)
 
@@ -377,6 +458,7 @@ class VoicePipeline:
 		self.pipeline: Optional[Pipeline] = None
 		self.runner: Optional[PipelineRunner] = None
 		self.task: Optional[PipelineTask] = None
+		self._text_to_agent: Optional[TextToAgentProcessor] = None
 		self._agent_to_tts: Optional[AgentToTTSProcessor] = None
 		self._speech_tracker: Optional[SpeechCompletionTracker] = None
 		self._transport: Optional[LocalAudioTransport] = None
@@ -384,71 +466,24 @@ class VoicePipeline:
 
 	async def initialize(self) -> bool:
 		"""Initialize pipeline components."""
+		vad_future: Optional[asyncio.Future] = None
 		try:
-			logger.debug(
-				'Creating LocalAudioTransport with VAD (%.1fs pause threshold)...',
-				USER_SILENCE_DELAY_SECONDS,
-			)
+			# Service, VAD and local-audio imports pull in ONNX Runtime, PyAudio and
+			# the vendor SDKs; importing them here keeps them out of the WebRTC
+			# server, which only needs the processors from this module
+			from pipecat.audio.vad.silero import SileroVADAnalyzer
+			from pipecat.audio.vad.vad_analyzer import VADParams
+			from pipecat.services.deepgram.stt import DeepgramSTTService
+			from pipecat.services.elevenlabs.tts import ElevenLabsTTSService
+			from pipecat.transports.local.audio import LocalAudioTransport, LocalAudioTransportParams
 			try:
-				vad_params = VADParams(stop_secs=USER_SILENCE_DELAY_SECONDS)
-				vad_analyzer = SileroVADAnalyzer(params=vad_params)
-				
-				transport_params = LocalAudioTransportParams(
-					audio_in_enabled=True,
-					audio_out_enabled=False,  # Disable local audio output - audio is streamed to frontend
-					vad_analyzer=vad_analyzer,
-				)
-				transport = LocalAudioTransport(transport_params)
-				logger.debug(
-					'LocalAudioTransport created with VAD (stop_secs=%.1f)',
-					USER_SILENCE_DELAY_SECONDS,
-				)
-			except OSError as e:
-				error_msg = str(e)
-				logger.error('Audio device error: %s', error_msg)
-				
-				try:
-					import pyaudio
-					pa = pyaudio.PyAudio()
-					logger.debug('Available audio input devices:')
-					has_input = False
-					for i in range(pa.get_device_count()):
-						info = pa.get_device_info_by_index(i)
-						if info['maxInputChannels'] > 0:
-							has_input = True
-							default_str = ' (DEFAULT)' if i == pa.get_default_input_device_info()['index'] else ''
-							logger.info(
-								'  Device %d: %s (channels: %d)%s',
-								i,
-								info['name'],
-								info['maxInputChannels'],
-								default_str,
-							)
-					pa.terminate()
-					
-					if not has_input:
-						logger.error('No audio input devices found!')
-						logger.error('Solutions:')
-						logger.error('  1. Check that a microphone is connected')
-						logger.error('  2. Check Windows microphone permissions (Settings > Privacy > Microphone)')
-						logger.error('  3. Ensure no other application is using the microphone')
-						logger.error('  4. Update audio drivers')
-					else:
-						logger.error('Solutions:')
-						logger.error('  1. Check Windows microphone permissions (Settings > Privacy > Microphone)')
-						logger.error('  2. Ensure no other application is using the microphone')
-						logger.error('  3. Try closing and reopening the application')
-						logger.error('  4. Restart your computer if the issue persists')
-				except Exception as list_error:
-					logger.warning('Could not list audio devices: %s', list_error)
-				
-				logger.error('Full error details:', exc_info=True)
-				return False
-			except Exception as e:
-				logger.error('Failed to create LocalAudioTransport: %s', e, exc_info=True)
-				return False
+				from deepgram import LiveOptions
+			except ImportError:
+				LiveOptions = None
 
-			self._transport = transport
+			# Overlaps the services below; see WebRTCPipeline.initialize
+			vad_params = VADParams(stop_secs=USER_SILENCE_DELAY_SECONDS)
+			vad_future = asyncio.ensure_future(asyncio.to_thread(SileroVADAnalyzer, params=vad_params))
 
 			logger.debug('Initializing Deepgram STT service...')
 			
@@ -481,7 +516,40 @@ class VoicePipeline:
 			)
 			logger.debug('ElevenLabs TTS service initialized (voice_id: %s)', self.elevenlabs_voice_id)
 
+			logger.debug(
+				'Creating LocalAudioTransport with VAD (%.1fs pause threshold)...',
+				USER_SILENCE_DELAY_SECONDS,
+			)
+			try:
+				vad_analyzer = await vad_future
+				
+				transport_params = LocalAudioTransportParams(
+					audio_in_enabled=True,
+					audio_out_enabled=False,  # Disable local audio output - audio is streamed to frontend
+					vad_analyzer=vad_analyzer,
+				)
+				transport = LocalAudioTransport(transport_params)
+				logger.debug(
+					'LocalAudioTransport created with VAD (stop_secs=%.1f)',
+					USER_SILENCE_DELAY_SECONDS,
+				)
+			except OSError as e:
+				error_msg = str(e)
+				logger.error('Audio device error: %s', error_msg)
+				
+				# PyAudio enumeration blocks; keep it off the event loop
+				await asyncio.to_thread(_log_audio_input_devices)
+				
+				logger.error('Full error details:', exc_info=True)
+				return False
+			except Exception as e:
+				logger.error('Failed to create LocalAudioTransport: %s', e, exc_info=True)
+				return False
+
+			self._transport = transport
+
 			text_to_agent = TextToAgentProcessor(self.agent_bridge)
+			self._text_to_agent = text_to_agent
 			self._agent_to_tts = AgentToTTSProcessor()
 			self._speech_tracker = SpeechCompletionTracker()
 			self._audio_stream_processor = AudioStreamProcessor()
@@ -522,6 +590,11 @@ class VoicePipeline:
 		except Exception as error:
 			logger.error('Failed to initialize voice pipeline: %s', error, exc_info=True)
 			return False
+		finally:
+			# No-op once awaited. If STT/TTS setup failed first this only discards
+			# the result; the model still finishes loading on its worker thread
+			if vad_future is not None:
+				vad_future.cancel()
 
 	async def run(self) -> None:
 		"""Run pipeline until cancelled."""
@@ -548,6 +621,19 @@ class VoicePipeline:
 		"""Stop pipeline and clean up resources."""
 		logger.info('Stopping voice pipeline completely...')
 		
+		# Stop feeding new utterances to the agent
+		if self._text_to_agent:
+			try:
+				await self._text_to_agent.aclose()
+			except Exception as e:
+				logger.warning('Error stopping transcription consumer: %s', e)
+		
+		# Let the bridge flush queued narration and stop its TTS worker
+		try:
+			await self.agent_bridge.stop()
+		except Exception as e:
+			logger.warning('Error stopping agent bridge: %s', e)
+		
 		# Cancel the runner task if it exists
 		if self.runner:
 			try:
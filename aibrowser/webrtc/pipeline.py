@@ -6,8 +6,6 @@ import asyncio
 import logging
 from typing import Optional
 
-from pipecat.audio.vad.silero import SileroVADAnalyzer
-from pipecat.audio.vad.vad_analyzer import VADParams
 from pipecat.pipeline.pipeline import Pipeline
 from pipecat.pipeline.runner import PipelineRunner
 from pipecat.pipeline.task import PipelineTask
@@ -59,19 +57,42 @@ class WebRTCPipeline:
         self._audio_stream_processor: Optional[AudioStreamProcessor] = None
         self._speech_tracker: Optional[SpeechCompletionTracker] = None
         self._agent_to_tts: Optional[AgentToTTSProcessor] = None
+        self._text_to_agent: Optional[TextToAgentProcessor] = None
 
     async def initialize(self) -> None:
         """Build Pipecat pipeline around the provided SmallWebRTC connection."""
         import time
         start_time = time.time()
         
+        # Silero pulls in ONNX Runtime; importing it here keeps it out of the
+        # WebRTC server until a voice connection is actually set up
+        from pipecat.audio.vad.silero import SileroVADAnalyzer
+        from pipecat.audio.vad.vad_analyzer import VADParams
         from pipecat.services.deepgram.stt import DeepgramSTTService
         from pipecat.services.elevenlabs.tts import ElevenLabsTTSService
 
         logger.info("Initializing WebRTC Pipecat pipeline for connection %s", self.connection.pc_id)
 
+        # Loading the Silero ONNX model blocks, so it runs on a worker thread
+        # while the STT/TTS services are built on the loop
         vad_params = VADParams(stop_secs=1.0)
-        vad_analyzer = SileroVADAnalyzer(params=vad_params)
+        vad_future = asyncio.ensure_future(asyncio.to_thread(SileroVADAnalyzer, params=vad_params))
+
+        try:
+            stt_service = DeepgramSTTService(
+                api_key=Config.DEEPGRAM_API_KEY,
+                language=self.deepgram_language,
+            )
+            tts_service = ElevenLabsTTSService(
+                api_key=Config.ELEVENLABS_API_KEY,
+                voice_id=self.elevenlabs_voice_id,
+                sample_rate=self.audio_out_sample_rate,
+            )
+            vad_analyzer = await vad_future
+        finally:
+            # No-op once awaited. If STT/TTS setup failed first this only discards
+            # the result; the model still finishes loading on its worker thread
+            vad_future.cancel()
 
         transport_params = TransportParams(
             audio_in_enabled=True,
@@ -92,6 +113,7 @@ class WebRTCPipeline:
 
         self._transport = transport
         text_to_agent = TextToAgentProcessor(self.agent_bridge)
+        self._text_to_agent = text_to_agent
         self._agent_to_tts = AgentToTTSProcessor()
         self._speech_tracker = SpeechCompletionTracker()
         self._audio_stream_processor = AudioStreamProcessor()
@@ -99,16 +121,6 @@ class WebRTCPipeline:
         self.agent_bridge.set_tts_processor(self._agent_to_tts)
         self.agent_bridge.set_speech_tracker(self._speech_tracker)
 
-        stt_service = DeepgramSTTService(
-            api_key=Config.DEEPGRAM_API_KEY,
-            language=self.deepgram_language,
-        )
-        tts_service = ElevenLabsTTSService(
-            api_key=Config.ELEVENLABS_API_KEY,
-            voice_id=self.elevenlabs_voice_id,
-            sample_rate=self.audio_out_sample_rate,
-        )
-
         self.pipeline = Pipeline(
             [
                 transport.input(),
@@ -145,6 +157,17 @@ class WebRTCPipeline:
     async def stop(self) -> None:
         """Stop pipeline and cleanup."""
         logger.info("Stopping WebRTC pipeline for %s", self.connection.pc_id)
+        if self._text_to_agent:
+            try:
+                await self._text_to_agent.aclose()
+            except Exception:
+                logger.debug("Error stopping transcription consumer", exc_info=True)
+
+        try:
+            await self.agent_bridge.stop()
+        except Exception:
+            logger.debug("Error stopping agent bridge", exc_info=True)
+
         if self.runner:
             try:
                 await self.runner.cancel()